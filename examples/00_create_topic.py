@@ -1,28 +1,14 @@
 #!/usr/bin/env python3
 """Create a topic with a specific member."""
 
-import os
 import sys
 
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-
-from dotenv import load_dotenv
-from zenzap_client import ZenzapClient
-
-load_dotenv()
+from _common import make_client, require_member_ids
 
 
 def main():
-    client = ZenzapClient(
-        api_key=os.environ["BOT_API_KEY"],
-        secret=os.environ["BOT_SECRET"],
-        base_url=os.getenv("API_BASE_URL", "https://api.zenzap.co")
-    )
-
-    member_ids = [m.strip() for m in os.environ.get("MEMBER_IDS", "").split(",") if m.strip()]
-    if not member_ids:
-        print("Error: No member IDs configured. Set MEMBER_IDS in .env")
-        sys.exit(1)
+    client = make_client()
+    member_ids = require_member_ids()
 
     print("Creating topic...")
     response = client.create_topic(
@@ -11,30 +11,18 @@ This example demonstrates topic (channel/group chat) operations:
 - Add and remove members
 """
 
-import os
 import sys
 import time
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-from dotenv import load_dotenv
-from zenzap_client import ZenzapClient
-
-load_dotenv()
+from _common import make_client, require_member_ids
 
 
 def main():
-    client = ZenzapClient(
-        api_key=os.environ["BOT_API_KEY"],
-        secret=os.environ["BOT_SECRET"],
-        base_url=os.getenv("API_BASE_URL", "https://api.zenzap.co")
-    )
+    # One timestamp per run keeps demo topic names and external IDs unique
+    now = int(time.time())
 
-    member_ids = [m.strip() for m in os.environ.get("MEMBER_IDS", "").split(",") if m.strip()]
-
-    if not member_ids:
-        print("Error: No member IDs configured")
-        sys.exit(1)
+    client = make_client()
+    member_ids = require_member_ids()
 
     print("=" * 60)
     print("Topic Management Examples")
@@ -43,7 +31,7 @@ def main():
     # Create a topic without external ID
     print("\n1. Creating topic without external ID...")
     response = client.create_topic(
-        name=f"Regular Topic {int(time.time())}",
+        name=f"Regular Topic {now}",
         members=member_ids[:1],
         description="A regular topic without external ID"
     )
@@ -57,7 +45,7 @@ def main():
 
     # Create a topic with external ID
     print("\n2. Creating topic with external ID...")
-    external_id = f"project-{int(time.time())}"
+    external_id = f"project-{now}"
 
     response = client.create_topic(
         name="Project Updates Channel",
@@ -118,7 +106,7 @@ def main():
 
     # Update topic
     print("\n6. Updating topic...")
-    new_name = f"Updated Topic Name {int(time.time())}"
+    new_name = f"Updated Topic Name {now}"
     response = client.update_topic(
         topic_id=topic_id,
         name=new_name,
@@ -9,30 +9,18 @@ This example demonstrates sending messages:
 - Send messages with external IDs for tracking
 """
 
-import os
 import sys
 import time
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-from dotenv import load_dotenv
-from zenzap_client import ZenzapClient
-
-load_dotenv()
+from _common import make_client, require_member_ids
 
 
 def main():
-    client = ZenzapClient(
-        api_key=os.environ["BOT_API_KEY"],
-        secret=os.environ["BOT_SECRET"],
-        base_url=os.getenv("API_BASE_URL", "https://api.zenzap.co")
-    )
+    # One timestamp per run keeps the demo topic name and message external ID unique
+    now = int(time.time())
 
-    member_ids = [m.strip() for m in os.environ.get("MEMBER_IDS", "").split(",") if m.strip()]
-
-    if not member_ids:
-        print("Error: No member IDs configured")
-        sys.exit(1)
+    client = make_client()
+    member_ids = require_member_ids()
 
     print("=" * 60)
     print("Message Examples")
@@ -41,7 +29,7 @@ def main():
     # Create a topic for messaging
     print("\n1. Creating topic for message examples...")
     response = client.create_topic(
-        name=f"Message Demo {int(time.time())}",
+        name=f"Message Demo {now}",
         members=member_ids[:1]
     )
 
@@ -90,7 +78,7 @@ def main():
 
     # Send message with external ID for tracking
     print("\n5. Sending message with external ID...")
-    external_msg_id = f"notification-{int(time.time())}"
+    external_msg_id = f"notification-{now}"
 
     response = client.send_message(
         topic_id=topic_id,
@@ -9,30 +9,21 @@ This example demonstrates task operations:
 - Create tasks with external IDs (e.g., for JIRA integration)
 """
 
-import os
 import sys
 import time
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from _common import make_client, require_member_ids
 
-from dotenv import load_dotenv
-from zenzap_client import ZenzapClient
-
-load_dotenv()
+DAY_MS = 24 * 60 * 60 * 1000
 
 
 def main():
-    client = ZenzapClient(
-        api_key=os.environ["BOT_API_KEY"],
-        secret=os.environ["BOT_SECRET"],
-        base_url=os.getenv("API_BASE_URL", "https://api.zenzap.co")
-    )
+    # One timestamp per run; demo names and due dates are derived from it
+    now = int(time.time())
+    now_ms = now * 1000
 
-    member_ids = [m.strip() for m in os.environ.get("MEMBER_IDS", "").split(",") if m.strip()]
-
-    if not member_ids:
-        print("Error: No member IDs configured")
-        sys.exit(1)
+    client = make_client()
+    member_ids = require_member_ids()
 
     print("=" * 60)
     print("Task Examples")
@@ -41,7 +32,7 @@ def main():
     # Create a topic for tasks
     print("\n1. Creating topic for task examples...")
     response = client.create_topic(
-        name=f"Task Demo {int(time.time())}",
+        name=f"Task Demo {now}",
         members=member_ids[:2] if len(member_ids) > 1 else member_ids
     )
 
@@ -84,7 +75,7 @@ def main():
     # Create task with due date
     print("\n4. Creating task with due date...")
     # Due date: 7 days from now (in milliseconds)
-    due_date_ms = int((time.time() + 7 * 24 * 60 * 60) * 1000)
+    due_date_ms = now_ms + 7 * DAY_MS
 
     response = client.create_task(
         topic_id=topic_id,
@@ -101,7 +92,7 @@ def main():
 
     # Create task with external ID (JIRA-style)
     print("\n5. Creating task with external ID (JIRA integration example)...")
-    external_task_id = f"PROJ-{int(time.time()) % 10000}"
+    external_task_id = f"PROJ-{now % 10000}"
 
     response = client.create_task(
         topic_id=topic_id,
@@ -109,7 +100,7 @@ def main():
         description="Deploy the latest version to production environment. "
                     "Ensure all tests pass before deployment.",
         assignee=member_ids[0],
-        due_date=int((time.time() + 3 * 24 * 60 * 60) * 1000),  # 3 days from now
+        due_date=now_ms + 3 * DAY_MS,  # 3 days from now
         external_id=external_task_id
     )
 
@@ -122,7 +113,7 @@ def main():
 
     # Create an urgent task
     print("\n6. Creating urgent task (due tomorrow)...")
-    tomorrow_ms = int((time.time() + 24 * 60 * 60) * 1000)
+    tomorrow_ms = now_ms + DAY_MS
 
     response = client.create_task(
         topic_id=topic_id,
@@ -10,19 +10,37 @@ Because the public API does not currently expose topic/task/message delete endpo
 cleanup is limited to:
 - Removing the current bot member from matching demo topics
 
+Listed pages and their ETags are kept in a local SQLite cache
+(~/.cache/zenzap/topics.db), so repeated dry-runs only download pages that
+changed since the previous run. Entries are scoped to the API base URL and
+bot, so switching environments or bots never reuses another one's pages.
+
 Usage:
     python3 examples/06_cleanup_demo_topics.py
     python3 examples/06_cleanup_demo_topics.py --apply
+    python3 examples/06_cleanup_demo_topics.py --no-cache
+    python3 examples/06_cleanup_demo_topics.py --fields
 """
 
 import argparse
+import hashlib
+import json
 import os
+import re
+import sqlite3
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from dotenv import load_dotenv
-from zenzap_client import ZenzapClient
+from zenzap_client import ApiResponse, ZenzapClient
+
+
+CACHE_PATH = os.path.expanduser("~/.cache/zenzap/topics.db")
+CACHE_MAX_AGE = 7 * 24 * 60 * 60  # seconds
 
 
 DEMO_PREFIXES = (
@@ -35,6 +53,81 @@ DEMO_PREFIXES = (
     "Q1 2024 Product Launch",
 )
 
+# Compiled once so each topic is matched in a single regex call instead of
+# one startswith()/substring check per pattern
+DEMO_PREFIX_RE = re.compile("|".join(re.escape(prefix) for prefix in DEMO_PREFIXES))
+DEMO_DESCRIPTION_RE = re.compile("quickstart example|project integration")
+
+# The only topic fields the cleanup reads. Requesting just these (--fields)
+# keeps the listed pages small, but the fields parameter is not part of the
+# documented API, so it is off by default.
+TOPIC_FIELDS = "id,name,description,externalId,members"
+
+
+class SQLiteETagCache:
+    """
+    ETag cache for ZenzapClient that persists responses between runs.
+
+    Implements the same get/set/clear methods as the client's in-memory
+    cache. Each GET path maps to the last response body and its ETag; the
+    client sends that ETag as If-None-Match and reuses the stored body on
+    304 Not Modified.
+
+    Rows are keyed by scope plus path, so one database file can serve
+    several base URLs and bots without one's ETags being sent for another.
+    """
+
+    def __init__(self, path, scope, max_age=CACHE_MAX_AGE):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Pages are prefetched on a worker thread, so share one connection
+        # behind a lock
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        self._prefix = f"{scope} "
+        self._max_age = max_age
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "path TEXT PRIMARY KEY, etag TEXT NOT NULL, "
+                "data BLOB NOT NULL, fetched_at REAL NOT NULL)"
+            )
+
+    def get(self, key):
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT etag, data, fetched_at FROM responses WHERE path = ?",
+                (self._prefix + key,),
+            ).fetchone()
+        if row is None:
+            return None
+
+        etag, data, fetched_at = row
+        if time.time() - fetched_at > self._max_age:
+            return None
+        return ApiResponse(status=200, data=json.loads(data), success=True, etag=etag)
+
+    def set(self, key, response, ttl):
+        # Entries expire after max_age, whatever ttl the client asks for
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (path, etag, data, fetched_at) "
+                "VALUES (?, ?, ?, ?)",
+                (self._prefix + key, response.etag, json.dumps(response.data), time.time()),
+            )
+
+    def clear(self):
+        with self._lock, self._conn:
+            self._conn.execute(
+                "DELETE FROM responses WHERE substr(path, 1, ?) = ?",
+                (len(self._prefix), self._prefix),
+            )
+
+
+def cache_scope(base_url, api_key):
+    """Identify one environment and bot, without storing the API key itself."""
+    key_hash = hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:16]
+    return f"{base_url.rstrip('/')}#{key_hash}"
+
 
 def parse_topics_payload(payload):
     """Normalize list_topics payload shapes."""
@@ -56,20 +149,53 @@ def parse_topics_payload(payload):
     return topics, next_cursor
 
 
+def iter_topics(client, limit, max_pages, fields=None):
+    """
+    Yield topics one page at a time, following nextCursor.
+
+    As soon as a page's cursor is known, the next page is requested in a
+    background thread, so it downloads while the caller filters this one.
+    """
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        cursor = None
+        future = executor.submit(client.list_topics, limit=limit, cursor=cursor, fields=fields)
+
+        for page in range(1, max_pages + 1):
+            response = future.result()
+            if not response.success:
+                print(f"Error: list_topics failed on page {page}: {response.data}")
+                sys.exit(1)
+
+            page_topics, next_cursor = parse_topics_payload(response.data)
+            print(f"Listed page {page}: {len(page_topics)} topics")
+
+            has_next = bool(next_cursor) and next_cursor != cursor
+            if has_next and page < max_pages:
+                future = executor.submit(
+                    client.list_topics, limit=limit, cursor=next_cursor, fields=fields
+                )
+
+            yield from page_topics
+
+            if not has_next:
+                return
+            cursor = next_cursor
+
+    print(f"Reached --max-pages ({max_pages}); stopping pagination.")
+
+
 def is_demo_topic(topic):
     name = (topic.get("name") or "").strip()
     description = (topic.get("description") or "").strip().lower()
     external_id = (topic.get("externalId") or "").strip()
 
-    if any(name.startswith(prefix) for prefix in DEMO_PREFIXES):
+    if DEMO_PREFIX_RE.match(name):
         return True
 
     if external_id and "project-" in external_id:
         return True
 
-    if "quickstart example" in description:
-        return True
-    if "project integration" in description:
+    if DEMO_DESCRIPTION_RE.search(description):
         return True
 
     return False
@@ -94,7 +220,27 @@ def main():
         default=20,
         help="Safety limit on pagination depth (default: 20).",
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=8,
+        help="Maximum topics to leave in parallel with --apply (default: 8).",
+    )
+    parser.add_argument(
+        "--fields",
+        action="store_const",
+        const=TOPIC_FIELDS,
+        help="Ask the server for only the topic fields the cleanup reads. "
+        "Not part of the documented API; servers may ignore or reject it.",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"Do not read or write the local page cache ({CACHE_PATH}).",
+    )
     args = parser.parse_args()
+    if args.concurrency < 1:
+        parser.error("--concurrency must be at least 1")
 
     load_dotenv()
 
@@ -106,7 +252,13 @@ def main():
         print("Error: BOT_API_KEY and BOT_SECRET must be set in .env")
         sys.exit(1)
 
-    client = ZenzapClient(api_key=api_key, secret=secret, base_url=base_url)
+    etag_cache = None if args.no_cache else SQLiteETagCache(CACHE_PATH, cache_scope(base_url, api_key))
+    client = ZenzapClient(
+        api_key=api_key,
+        secret=secret,
+        base_url=base_url,
+        etag_cache=etag_cache,
+    )
 
     me_response = client.get_current_member()
     if not me_response.success:
@@ -125,27 +277,15 @@ def main():
     print(f"Bot ID: {bot_id}")
     print(f"Base URL: {base_url}")
 
-    all_topics = []
-    cursor = None
-
-    for page in range(1, args.max_pages + 1):
-        response = client.list_topics(limit=args.limit, cursor=cursor)
-        if not response.success:
-            print(f"Error: list_topics failed on page {page}: {response.data}")
-            sys.exit(1)
-
-        page_topics, next_cursor = parse_topics_payload(response.data)
-        all_topics.extend(page_topics)
-        print(f"Listed page {page}: {len(page_topics)} topics")
+    # Filter while paginating so only demo topics are kept in memory
+    total_topics = 0
+    demo_topics = []
+    for topic in iter_topics(client, args.limit, args.max_pages, args.fields):
+        total_topics += 1
+        if is_demo_topic(topic):
+            demo_topics.append(topic)
 
-        if not next_cursor or next_cursor == cursor:
-            break
-        cursor = next_cursor
-    else:
-        print(f"Reached --max-pages ({args.max_pages}); stopping pagination.")
-
-    demo_topics = [topic for topic in all_topics if is_demo_topic(topic)]
-    print(f"\nFound {len(demo_topics)} demo topic(s) out of {len(all_topics)} total.")
+    print(f"\nFound {len(demo_topics)} demo topic(s) out of {total_topics} total.")
 
     if not demo_topics:
         print("Nothing to clean up.")
@@ -155,11 +295,13 @@ def main():
     left_topics_count = 0
     skipped_not_member_count = 0
     failed_topics = 0
+    topics_to_leave = []
 
     for topic in demo_topics:
         topic_id = topic.get("id", "")
         topic_name = topic.get("name", "(unnamed)")
-        current_members = topic.get("members") or []
+        # Hash lookup instead of scanning the member list
+        current_members = frozenset(topic.get("members") or ())
         bot_is_member = bot_id in current_members
 
         print(f"\n- Topic: {topic_name} ({topic_id})")
@@ -167,21 +309,29 @@ def main():
 
         if bot_is_member:
             topics_with_bot_member += 1
+            topics_to_leave.append(topic)
         else:
             skipped_not_member_count += 1
             print("  Skip: bot is not a member of this topic")
-            continue
-
-        if not args.apply:
-            continue
 
-        remove_response = client.remove_topic_members(topic_id, [bot_id])
-        if remove_response.success:
-            left_topics_count += 1
-            print("  Bot removed successfully")
-        else:
-            failed_topics += 1
-            print(f"  Remove bot failed: {remove_response.data}")
+    if args.apply and topics_to_leave:
+        print(f"\nLeaving {len(topics_to_leave)} topic(s), up to {args.concurrency} at a time...")
+
+        # The removals are independent; the pool size bounds how many are in
+        # flight at once so the API is not hit with every request together
+        with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+            responses = executor.map(
+                lambda topic: client.remove_topic_members(topic.get("id", ""), [bot_id]),
+                topics_to_leave,
+            )
+            for topic, remove_response in zip(topics_to_leave, responses):
+                topic_name = topic.get("name", "(unnamed)")
+                if remove_response.success:
+                    left_topics_count += 1
+                    print(f"  Bot removed from {topic_name}")
+                else:
+                    failed_topics += 1
+                    print(f"  Remove bot failed for {topic_name}: {remove_response.data}")
 
     print("\n" + "=" * 60)
     print("Cleanup Summary")
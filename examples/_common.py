@@ -0,0 +1,55 @@
+"""
+Shared setup for the example scripts.
+
+Credentials and member IDs are read from the environment (loaded from .env)
+once per process, so running several examples in the same interpreter does
+not re-parse MEMBER_IDS or build a new client each time.
+"""
+
+import functools
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dotenv import load_dotenv
+from zenzap_client import ZenzapClient
+
+load_dotenv()
+
+
+@functools.lru_cache(maxsize=1)
+def get_member_ids() -> tuple[str, ...]:
+    """Return the organization member IDs configured in MEMBER_IDS."""
+    raw = os.environ.get("MEMBER_IDS", "")
+    return tuple(member_id for member_id in (m.strip() for m in raw.split(",")) if member_id)
+
+
+def require_member_ids() -> tuple[str, ...]:
+    """Return the configured member IDs, exiting with an error if there are none."""
+    member_ids = get_member_ids()
+    if not member_ids:
+        print("Error: No member IDs configured. Set MEMBER_IDS in .env")
+        sys.exit(1)
+    return member_ids
+
+
+def client_settings() -> dict[str, str]:
+    """Return the keyword arguments for constructing a client from .env."""
+    return {
+        "api_key": os.environ["BOT_API_KEY"],
+        "secret": os.environ["BOT_SECRET"],
+        "base_url": os.getenv("API_BASE_URL", "https://api.zenzap.co"),
+    }
+
+
+@functools.lru_cache(maxsize=1)
+def make_client() -> ZenzapClient:
+    """
+    Return the blocking client shared by the examples.
+
+    The async examples build their own AsyncZenzapClient from
+    client_settings() instead, since an async client is bound to the event
+    loop it is used in.
+    """
+    return ZenzapClient(**client_settings())
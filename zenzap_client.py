@@ -3,41 +3,140 @@ Zenzap API Client
 
 A Python client for interacting with the Zenzap External Integration API.
 Handles authentication, HMAC signature generation, and API requests.
+
+Two clients are provided:
+- ZenzapClient: blocking client built on requests (or httpx, for HTTP/2)
+- AsyncZenzapClient: asyncio client built on httpx, for running independent
+  calls concurrently
 """
 
+from __future__ import annotations
+
+import asyncio
+import functools
+import gzip
 import hashlib
-import hmac
 import json
+import logging
+import math
+import random
+import re
+import threading
 import time
-from typing import Any, Optional
-from dataclasses import dataclass
-from urllib.parse import quote, urlencode
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
+from typing import TYPE_CHECKING, Any, Awaitable, Optional, Union
+from dataclasses import dataclass, replace
+from urllib.parse import quote, quote_plus, urlencode
+
+from zenzap_signing import make_signer
+
+# The HTTP libraries are imported by the client that uses them, so a
+# blocking client never loads httpx and short-lived scripts start faster
+if TYPE_CHECKING:
+    import httpx
+    import requests
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# orjson parses and produces bytes directly and is several times faster than
+# the stdlib; both raise ValueError subclasses on invalid input
+if orjson is not None:
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+else:
+    _json_loads = json.loads
+
+    def _json_dumps(obj: Any) -> bytes:
+        """Serialize obj to compact UTF-8 JSON, matching orjson's output."""
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+logger = logging.getLogger(__name__)
+
+
+@functools.lru_cache(maxsize=1024)
+def _quote_segment(segment: str) -> str:
+    """Percent-encode one path segment; IDs recur, so results are memoized."""
+    return quote(segment, safe="")
+
+
+@functools.lru_cache(maxsize=256)
+def _build_query(items: tuple[tuple[str, str], ...]) -> str:
+    """URL-encode query parameters that are already converted to strings."""
+    return urlencode(items)
+
+
+@functools.lru_cache(maxsize=None)
+def _log_hash_backend() -> None:
+    """
+    Log, once per process, which SHA-256 implementation signs requests.
+
+    hashlib's OpenSSL build picks SHA-NI (x86) or the ARMv8 SHA-2
+    instructions at load time when the CPU has them. The CPU flag check is
+    best-effort and only works on Linux.
+    """
+    import ssl
+
+    try:
+        with open("/proc/cpuinfo") as cpuinfo:
+            has_sha_extensions: Optional[bool] = bool(
+                re.search(r"\b(sha_ni|sha2)\b", cpuinfo.read())
+            )
+    except OSError:
+        has_sha_extensions = None
 
-import requests
+    logger.debug(
+        "HMAC-SHA256 signing via %s (%s); CPU SHA extensions: %s",
+        hashlib.sha256.__name__,
+        ssl.OPENSSL_VERSION,
+        "unknown" if has_sha_extensions is None else has_sha_extensions,
+    )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ApiResponse:
-    """Represents an API response with status code and data."""
+    """
+    Represents an API response with status code and data.
+
+    The fields cannot be reassigned, but data is an ordinary dict or list.
+    Cached responses are stored and handed out as copies, so changing data
+    never affects the cache or another caller.
+    """
     status: int
     data: Any
     success: bool
+    etag: Optional[str] = None
 
     @classmethod
-    def from_response(cls, response: requests.Response) -> "ApiResponse":
-        try:
-            data = response.json()
-        except ValueError:
-            text = response.text.strip()
-            data = {"raw": text} if text else {}
+    def from_response(cls, response: Union[requests.Response, httpx.Response]) -> "ApiResponse":
+        raw = response.content
+        if not raw:
+            # 204s and bare acknowledgements; skip the decoder and its error path
+            data = {}
+        else:
+            try:
+                data = _json_loads(raw)
+            except ValueError:
+                text = response.text.strip()
+                data = {"raw": text} if text else {}
         return cls(
             status=response.status_code,
             data=data,
-            success=200 <= response.status_code < 300
+            success=200 <= response.status_code < 300,
+            etag=response.headers.get("ETag"),
         )
 
+    def copy(self) -> "ApiResponse":
+        """Return a copy of this response whose data is independent of it."""
+        return replace(self, data=deepcopy(self.data))
+
     @classmethod
-    def from_exception(cls, exception: requests.RequestException) -> "ApiResponse":
+    def from_exception(cls, exception: Exception) -> "ApiResponse":
         """Build a normalized error response for transport-level failures."""
         return cls(
             status=0,
@@ -49,28 +148,97 @@ class ApiResponse:
         )
 
 
-class ZenzapClient:
-    """
-    Client for the Zenzap External Integration API.
+@dataclass(frozen=True, slots=True)
+class BootstrapResult:
+    """Responses from create_topic_with_bootstrap, in request order."""
+    topic: ApiResponse
+    messages: list[ApiResponse]
+    tasks: list[ApiResponse]
 
-    Handles authentication using Bearer tokens and HMAC-SHA256 signatures.
 
-    Example usage:
-        client = ZenzapClient(
-            api_key="your_bot_api_key",
-            secret="your_bot_secret"
-        )
+class _ResponseCache:
+    """
+    Thread-safe LRU cache of successful GET responses with per-entry expiry.
 
-        # Get current bot info
-        response = client.get_current_member()
-        print(response.data)
+    Keys are signed request paths (including the query string), so two GETs
+    share an entry only if they would hit the exact same URL. Responses are
+    copied on the way in and out, so callers may modify what they get.
+    """
 
-        # Create a topic
-        response = client.create_topic(
-            name="My Topic",
-            members=["member-uuid-1", "member-uuid-2"]
-        )
+    def __init__(self, max_entries: int = 256):
+        self._entries: OrderedDict[str, tuple[float, ApiResponse]] = OrderedDict()
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[ApiResponse]:
+        """Return the cached response for key, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, response = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+        return response.copy()
+
+    def set(self, key: str, response: ApiResponse, ttl: float) -> None:
+        """Store a copy of response under key for ttl seconds, evicting the oldest entries."""
+        response = response.copy()
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, response)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every cached response."""
+        with self._lock:
+            self._entries.clear()
+
+    def discard_prefix(self, prefix: str) -> None:
+        """Drop every cached response whose key starts with prefix."""
+        with self._lock:
+            for key in [key for key in self._entries if key.startswith(prefix)]:
+                del self._entries[key]
+
+
+class _BaseZenzapClient:
     """
+    Transport-independent part of the Zenzap clients.
+
+    Holds the credentials, request signing and every endpoint method.
+    Subclasses implement _request for a concrete HTTP library.
+    """
+
+    # How long lookups that rarely change (bot identity, external ID
+    # resolution) are served from the in-process cache, in seconds
+    LOOKUP_CACHE_TTL = 300.0
+
+    # Request bodies larger than this many bytes are gzip-compressed when
+    # compress_requests is enabled; smaller ones don't gain enough to pay
+    # for the compression
+    COMPRESS_MIN_BYTES = 1024
+
+    # Transient statuses worth retrying, and the cap on a single backoff
+    # delay in seconds. GETs are always retried; writes carrying an
+    # Idempotency-Key only with retry_writes=True, since the public API does
+    # not document deduplicating on that header.
+    RETRY_STATUSES = frozenset({429, 502, 503, 504})
+    RETRY_BACKOFF_MAX = 30.0
+
+    # Connection attempts that fail before anything is sent are safe to
+    # repeat for every method, so requests that are otherwise sent once
+    # still get up to this many retries (never more than max_retries)
+    CONNECT_RETRIES = 2
+
+    # Other collections whose cached GETs a write can make stale: messages
+    # and polls are also listed under their topic
+    _RELATED_COLLECTIONS = {
+        "/v2/messages": ("/v2/topics",),
+        "/v2/polls": ("/v2/topics",),
+    }
 
     def __init__(
         self,
@@ -78,6 +246,12 @@ class ZenzapClient:
         secret: str,
         base_url: str = "https://api.zenzap.co",
         timeout: float = 30.0,
+        *,
+        etag_cache: Optional[Any] = None,
+        compress_requests: bool = False,
+        max_retries: int = 3,
+        cache_ttl: float = 0.0,
+        retry_writes: bool = False,
     ):
         """
         Initialize the Zenzap client.
@@ -87,13 +261,46 @@ class ZenzapClient:
             secret: Your bot's secret for HMAC signatures (BOT_SECRET)
             base_url: API base URL (default: https://api.zenzap.co)
             timeout: Request timeout in seconds (default: 30)
+            etag_cache: Store for ETag-validated GET responses, with the same
+                get/set/clear methods as the default in-memory LRU; pass a
+                persistent one to revalidate across runs
+            compress_requests: Send request bodies over COMPRESS_MIN_BYTES
+                with Content-Encoding: gzip (default: False)
+            max_retries: Retries for safe requests that hit a transient
+                error or RETRY_STATUSES response (default: 3); 0 disables
+                all retries. Each attempt is bounded by timeout, so a
+                request that keeps failing returns after at most about
+                (max_retries + 1) * timeout plus max_retries backoff delays
+                of up to RETRY_BACKOFF_MAX each.
+            cache_ttl: Seconds to serve any successful GET from memory; writes
+                evict the affected collection (default: 0, disabled). Lookups
+                are always cached for at least LOOKUP_CACHE_TTL.
+            retry_writes: Also retry the POSTs that send an Idempotency-Key
+                (default: False). Only enable this if the server deduplicates
+                on that header; otherwise a retry after a timeout can create
+                the resource twice.
         """
         self.api_key = api_key
         self.secret = secret
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
-
-    def _generate_signature(self, data: str, timestamp: int) -> str:
+        self.compress_requests = compress_requests
+        self.max_retries = max_retries
+        self.cache_ttl = cache_ttl
+        self.retry_writes = retry_writes
+        self._sign = make_signer(secret.encode("utf-8"))
+        if logger.isEnabledFor(logging.DEBUG):
+            _log_hash_backend()
+        self._cache = _ResponseCache()
+        # Last response per GET path that carried an ETag, for If-None-Match
+        self._etag_cache = etag_cache if etag_cache is not None else _ResponseCache()
+
+    def clear_cache(self) -> None:
+        """Drop all cached GET responses, including ETag validators."""
+        self._cache.clear()
+        self._etag_cache.clear()
+
+    def _generate_signature(self, data: Union[str, bytes], timestamp: int) -> str:
         """
         Generate HMAC-SHA256 signature for request authentication.
 
@@ -102,18 +309,20 @@ class ZenzapClient:
         - POST/PATCH/DELETE: the JSON request body
 
         Args:
-            data: The data to sign (path for GET, body for POST/PATCH/DELETE)
+            data: The data to sign (path for GET, body bytes for POST/PATCH/DELETE)
             timestamp: Unix timestamp in milliseconds
 
         Returns:
             Hex-encoded HMAC-SHA256 signature
         """
-        payload = f"{timestamp}.{data}"
-        return hmac.new(
-            self.secret.encode("utf-8"),
-            payload.encode("utf-8"),
-            hashlib.sha256
-        ).hexdigest()
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        return self._sign(data, timestamp)
+
+    @staticmethod
+    def _compact(**fields: Any) -> dict[str, Any]:
+        """Return the request body fields that were given, skipping None values."""
+        return {key: value for key, value in fields.items() if value is not None}
 
     @staticmethod
     def _build_path(path: str, params: Optional[dict[str, Any]] = None) -> str:
@@ -121,71 +330,167 @@ class ZenzapClient:
         if not params:
             return path
 
-        query = urlencode(
-            {k: v for k, v in params.items() if v is not None},
-            doseq=True,
-        )
+        # Values are converted to str before the memoized lookup: 1, 1.0 and
+        # True hash and compare equal, so they would otherwise share an entry
+        query = _build_query(tuple(
+            (key, value if isinstance(value, str) else str(value))
+            for key, value in params.items()
+            if value is not None
+        ))
         return f"{path}?{query}" if query else path
 
-    def _request(self, method: str, path: str, body: Optional[dict] = None) -> ApiResponse:
+    @staticmethod
+    def _build_paginated(path: str, limit: int, cursor: Optional[str]) -> str:
         """
-        Make an authenticated request to the API.
+        Build a signed path for the plain ``limit``/``cursor`` list query.
 
-        Handles timestamp generation, HMAC signature, and headers for all methods.
+        Produces the same string as ``_build_path`` for those two parameters
+        without going through ``urlencode``; list pagination is the hottest
+        caller.
+        """
+        if cursor is None:
+            return f"{path}?limit={limit}"
+        return f"{path}?limit={limit}&cursor={quote_plus(cursor, safe='')}"
+
+    def _prepare_request(
+        self,
+        method: str,
+        path: str,
+        body: Optional[dict] = None,
+        idempotency_key: Optional[str] = None,
+    ) -> tuple[dict[str, str], Optional[bytes]]:
+        """
+        Build the signed headers and serialized body for a request.
+
+        Shared by the blocking and async clients so both sign requests the
+        same way.
 
         Args:
             method: HTTP method (GET, POST, PATCH, DELETE)
             path: API path (e.g., "/v2/topics")
             body: Request body as dictionary (for POST/PATCH/DELETE)
+            idempotency_key: Value for the Idempotency-Key header, if any
 
         Returns:
-            ApiResponse with status and data
+            Tuple of (headers, body bytes or None)
         """
         timestamp = int(time.time() * 1000)
-        url = f"{self.base_url}{path}"
-
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "X-Timestamp": str(timestamp),
-        }
 
-        if body is not None:
-            body_str = json.dumps(body, separators=(",", ":"))
-            signature = self._generate_signature(body_str, timestamp)
-            headers["X-Signature"] = signature
-            headers["Content-Type"] = "application/json"
+        # Authorization is a default header on each client's session, so
+        # only the per-request headers are built here, in one literal
+        if body is None:
+            body_bytes = None
+            headers = {
+                "X-Timestamp": str(timestamp),
+                # Paths are built from quote()/urlencode() output, so ASCII
+                "X-Signature": self._generate_signature(path.encode("ascii"), timestamp),
+            }
         else:
-            body_str = None
-            signature = self._generate_signature(path, timestamp)
-            headers["X-Signature"] = signature
-
-        try:
-            response = requests.request(
-                method,
-                url,
-                headers=headers,
-                data=body_str,
-                timeout=self.timeout,
-            )
-            return ApiResponse.from_response(response)
-        except requests.RequestException as exception:
-            return ApiResponse.from_exception(exception)
-
-    def _get(self, path: str) -> ApiResponse:
-        """Make a GET request to the API."""
-        return self._request("GET", path)
+            # The exact bytes that are signed are the bytes that are sent
+            body_bytes = _json_dumps(body)
+            headers = {
+                "X-Timestamp": str(timestamp),
+                "X-Signature": self._generate_signature(body_bytes, timestamp),
+                "Content-Type": "application/json",
+            }
+            if self.compress_requests and len(body_bytes) > self.COMPRESS_MIN_BYTES:
+                # The signature covers the uncompressed JSON, which is what
+                # the server sees after decoding the body
+                body_bytes = gzip.compress(body_bytes, compresslevel=1)
+                headers["Content-Encoding"] = "gzip"
+
+        if idempotency_key is not None:
+            headers["Idempotency-Key"] = idempotency_key
+
+        return headers, body_bytes
+
+    def _retry_attempts(self, method: str, idempotency_key: Optional[str]) -> int:
+        """Return how many times a request may be sent in total."""
+        if method == "GET" or (self.retry_writes and idempotency_key is not None):
+            return self.max_retries + 1
+        return 1
+
+    def _is_connect_error(self, exception: Exception) -> bool:
+        """
+        Return whether a transport error happened before the request was sent.
 
-    def _post(self, path: str, body: dict) -> ApiResponse:
-        """Make a POST request to the API."""
-        return self._request("POST", path, body)
+        requests reports a refused or unresolvable host as a ConnectionError
+        wrapping urllib3's MaxRetryError, so that error's reason is checked too.
+        """
+        if isinstance(exception, self._connect_errors):
+            return True
+        reason = getattr(exception.args[0], "reason", None) if exception.args else None
+        return isinstance(reason, self._connect_errors)
+
+    def _may_retry(self, attempt: int, attempts: int, exception: Exception) -> bool:
+        """Return whether a request that failed with a transient error may be resent."""
+        if attempt < attempts:
+            return True
+        return attempt <= min(self.CONNECT_RETRIES, self.max_retries) and self._is_connect_error(exception)
+
+    def _retry_delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """
+        Return the seconds to wait before resending a failed request.
 
-    def _patch(self, path: str, body: dict) -> ApiResponse:
-        """Make a PATCH request to the API."""
-        return self._request("PATCH", path, body)
+        Honours a numeric Retry-After header; otherwise backs off
+        exponentially from 0.5s with a little jitter so concurrent callers
+        do not retry in lockstep.
+        """
+        if retry_after:
+            try:
+                return min(max(float(retry_after), 0.0), self.RETRY_BACKOFF_MAX)
+            except ValueError:
+                pass  # HTTP-date form; fall back to the computed backoff
+        return min(self.RETRY_BACKOFF_MAX, 0.5 * 2 ** attempt) + random.uniform(0, 0.1)
+
+    def _conditional_entry(self, method: str, path: str) -> Optional[ApiResponse]:
+        """Return the stored response to revalidate with If-None-Match, if any."""
+        return self._etag_cache.get(path) if method == "GET" else None
+
+    def _finish_response(
+        self,
+        method: str,
+        path: str,
+        response: Union[requests.Response, httpx.Response],
+        revalidated: Optional[ApiResponse],
+        cache_ttl: float,
+    ) -> ApiResponse:
+        """
+        Turn a raw HTTP response into an ApiResponse and update the caches.
 
-    def _delete(self, path: str, body: dict) -> ApiResponse:
-        """Make a DELETE request to the API."""
-        return self._request("DELETE", path, body)
+        A 304 Not Modified answer to a conditional GET returns the stored
+        response, so unchanged pages are not downloaded again.
+        """
+        if response.status_code == 304 and revalidated is not None:
+            result = revalidated
+        else:
+            result = ApiResponse.from_response(response)
+            if method == "GET" and result.success and result.etag:
+                self._etag_cache.set(path, result, math.inf)
+
+        if cache_ttl and result.success:
+            self._cache.set(path, result, cache_ttl)
+        elif method != "GET" and result.success:
+            self._invalidate_cached(path)
+        return result
+
+    def _invalidate_cached(self, path: str) -> None:
+        """Drop cached GETs that a successful write to path may have changed."""
+        collection = "/".join(path.split("/", 3)[:3])
+        self._cache.discard_prefix(collection)
+        for related in self._RELATED_COLLECTIONS.get(collection, ()):
+            self._cache.discard_prefix(related)
+
+    def _request(
+        self,
+        method: str,
+        path: str,
+        body: Optional[dict] = None,
+        cache_ttl: float = 0.0,
+        idempotency_key: Optional[str] = None,
+    ) -> ApiResponse:
+        """Send a request; implemented by each concrete client."""
+        raise NotImplementedError
 
     # =========================================================================
     # Member Endpoints
@@ -195,10 +500,12 @@ class ZenzapClient:
         """
         Get information about the current bot.
 
+        The response is cached for LOOKUP_CACHE_TTL seconds.
+
         Returns:
             ApiResponse with member data including id, name, email, status
         """
-        return self._get("/v2/members/me")
+        return self._request("GET", "/v2/members/me", cache_ttl=self.LOOKUP_CACHE_TTL)
 
     def list_members(
         self,
@@ -217,13 +524,12 @@ class ZenzapClient:
         Returns:
             ApiResponse with list of members
         """
-        params: dict[str, Any] = {
-            "limit": limit,
-            "cursor": cursor,
-            "emails": ",".join(emails) if emails is not None else None,
-        }
-        path = self._build_path("/v2/members", params)
-        return self._get(path)
+        if emails is None:
+            path = self._build_paginated("/v2/members", limit, cursor)
+        else:
+            params: dict[str, Any] = {"limit": limit, "cursor": cursor, "emails": ",".join(emails)}
+            path = self._build_path("/v2/members", params)
+        return self._request("GET", path)
 
     # =========================================================================
     # Topic Endpoints
@@ -250,16 +556,50 @@ class ZenzapClient:
         Returns:
             ApiResponse with created topic data including id, name, createdAt
         """
-        body: dict[str, Any] = {
+        body = {
             "name": name,
             "members": members,
+            **self._compact(description=description, externalId=external_id),
         }
-        if description is not None:
-            body["description"] = description
-        if external_id is not None:
-            body["externalId"] = external_id
+        return self._request("POST", "/v2/topics", body, idempotency_key=uuid.uuid4().hex)
 
-        return self._post("/v2/topics", body)
+    def create_topic_with_bootstrap(
+        self,
+        name: str,
+        members: list[str],
+        description: Optional[str] = None,
+        external_id: Optional[str] = None,
+        initial_messages: Optional[list[str]] = None,
+        initial_tasks: Optional[list[dict[str, Any]]] = None,
+    ) -> BootstrapResult:
+        """
+        Create a topic, then post its opening messages and tasks.
+
+        The API has no composite endpoint, so this is one create_topic call
+        followed by the messages and tasks that depend on its ID. Nothing
+        else is sent if the topic cannot be created.
+
+        Args:
+            name: Topic name (max 64 characters)
+            members: List of member UUIDs to add (min 1)
+            description: Optional topic description
+            external_id: Optional external identifier for tracking
+            initial_messages: Message texts to send, in order
+            initial_tasks: Task bodies using API field names
+                (title, description, assignee, dueDate, externalId)
+
+        Returns:
+            BootstrapResult with the topic response and one response per
+            message and task
+        """
+        topic = self.create_topic(name, members, description, external_id)
+        if not topic.success:
+            return BootstrapResult(topic=topic, messages=[], tasks=[])
+
+        topic_id = topic.data["id"]
+        messages = [self.send_message(topic_id, text) for text in initial_messages or ()]
+        tasks = self.create_tasks_batch(topic_id, initial_tasks or [])
+        return BootstrapResult(topic=topic, messages=messages, tasks=tasks)
 
     def get_topic(self, topic_id: str) -> ApiResponse:
         """
@@ -271,7 +611,7 @@ class ZenzapClient:
         Returns:
             ApiResponse with topic details
         """
-        return self._get(f"/v2/topics/{quote(topic_id, safe='')}")
+        return self._request("GET", f"/v2/topics/{_quote_segment(topic_id)}")
 
     def get_topic_by_external_id(self, external_id: str) -> ApiResponse:
         """
@@ -281,28 +621,46 @@ class ZenzapClient:
         the full external ID (botId:externalId format). If created by your bot,
         you can use just the external ID part.
 
+        Successful lookups are cached for LOOKUP_CACHE_TTL seconds; call
+        clear_cache() to force a fresh lookup.
+
         Args:
             external_id: The external identifier
 
         Returns:
             ApiResponse with topic details (404 if not found or not a member)
         """
-        encoded_external_id = quote(external_id, safe="")
-        return self._get(f"/v2/topics/external/{encoded_external_id}")
+        encoded_external_id = _quote_segment(external_id)
+        return self._request(
+            "GET",
+            f"/v2/topics/external/{encoded_external_id}",
+            cache_ttl=self.LOOKUP_CACHE_TTL,
+        )
 
-    def list_topics(self, limit: int = 50, cursor: Optional[str] = None) -> ApiResponse:
+    def list_topics(
+        self,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        fields: Optional[str] = None,
+    ) -> ApiResponse:
         """
         List all topics where the bot is a member.
 
         Args:
             limit: Maximum number of topics to return (default: 50)
             cursor: Pagination cursor for next page
+            fields: Comma-separated topic fields to return
+                (e.g., "id,name,members"); all fields if omitted. Not part
+                of the documented API, so the server may ignore it.
 
         Returns:
             ApiResponse with list of topics
         """
-        path = self._build_path("/v2/topics", {"limit": limit, "cursor": cursor})
-        return self._get(path)
+        if fields is None:
+            path = self._build_paginated("/v2/topics", limit, cursor)
+        else:
+            path = self._build_path("/v2/topics", {"limit": limit, "cursor": cursor, "fields": fields})
+        return self._request("GET", path)
 
     def update_topic(
         self,
@@ -321,13 +679,8 @@ class ZenzapClient:
         Returns:
             ApiResponse with updated topic data
         """
-        body = {}
-        if name is not None:
-            body["name"] = name
-        if description is not None:
-            body["description"] = description
-
-        return self._patch(f"/v2/topics/{quote(topic_id, safe='')}", body)
+        body = self._compact(name=name, description=description)
+        return self._request("PATCH", f"/v2/topics/{_quote_segment(topic_id)}", body)
 
     def add_topic_members(self, topic_id: str, member_ids: list[str]) -> ApiResponse:
         """
@@ -340,7 +693,11 @@ class ZenzapClient:
         Returns:
             ApiResponse with result
         """
-        return self._post(f"/v2/topics/{quote(topic_id, safe='')}/members", {"memberIds": member_ids})
+        return self._request(
+            "POST",
+            f"/v2/topics/{_quote_segment(topic_id)}/members",
+            {"memberIds": member_ids},
+        )
 
     def remove_topic_members(self, topic_id: str, member_ids: list[str]) -> ApiResponse:
         """
@@ -353,7 +710,11 @@ class ZenzapClient:
         Returns:
             ApiResponse with result
         """
-        return self._delete(f"/v2/topics/{quote(topic_id, safe='')}/members", {"memberIds": member_ids})
+        return self._request(
+            "DELETE",
+            f"/v2/topics/{_quote_segment(topic_id)}/members",
+            {"memberIds": member_ids},
+        )
 
     def get_topic_messages(
         self,
@@ -394,8 +755,8 @@ class ZenzapClient:
             "includeSystem": str(include_system).lower() if include_system is not None else None,
             "threadId": thread_id,
         }
-        path = self._build_path(f"/v2/topics/{quote(topic_id, safe='')}/messages", params)
-        return self._get(path)
+        path = self._build_path(f"/v2/topics/{_quote_segment(topic_id)}/messages", params)
+        return self._request("GET", path)
 
     # =========================================================================
     # Message Endpoints
@@ -418,14 +779,12 @@ class ZenzapClient:
         Returns:
             ApiResponse with message data including id, topicId, createdAt
         """
-        body: dict[str, Any] = {
+        body = {
             "topicId": topic_id,
             "text": text,
+            **self._compact(externalId=external_id),
         }
-        if external_id is not None:
-            body["externalId"] = external_id
-
-        return self._post("/v2/messages", body)
+        return self._request("POST", "/v2/messages", body, idempotency_key=uuid.uuid4().hex)
 
     def add_reaction(self, message_id: str, reaction: str) -> ApiResponse:
         """
@@ -438,7 +797,11 @@ class ZenzapClient:
         Returns:
             ApiResponse with reaction details
         """
-        return self._post(f"/v2/messages/{quote(message_id, safe='')}/reactions", {"reaction": reaction})
+        return self._request(
+            "POST",
+            f"/v2/messages/{_quote_segment(message_id)}/reactions",
+            {"reaction": reaction},
+        )
 
     def mark_message_delivered(self, message_id: str) -> ApiResponse:
         """
@@ -450,7 +813,7 @@ class ZenzapClient:
         Returns:
             ApiResponse with result
         """
-        return self._post(f"/v2/messages/{quote(message_id, safe='')}/delivered", {})
+        return self._request("POST", f"/v2/messages/{_quote_segment(message_id)}/delivered", {})
 
     def mark_message_read(self, message_id: str) -> ApiResponse:
         """
@@ -462,7 +825,7 @@ class ZenzapClient:
         Returns:
             ApiResponse with result
         """
-        return self._post(f"/v2/messages/{quote(message_id, safe='')}/read", {})
+        return self._request("POST", f"/v2/messages/{_quote_segment(message_id)}/read", {})
 
     # =========================================================================
     # Task Endpoints
@@ -491,20 +854,28 @@ class ZenzapClient:
         Returns:
             ApiResponse with task data including id, topicId, title, createdAt
         """
-        body: dict[str, Any] = {
+        body = {
             "topicId": topic_id,
             "title": title,
+            **self._compact(
+                description=description,
+                assignee=assignee,
+                dueDate=due_date,
+                externalId=external_id,
+            ),
         }
-        if description is not None:
-            body["description"] = description
-        if assignee is not None:
-            body["assignee"] = assignee
-        if due_date is not None:
-            body["dueDate"] = due_date
-        if external_id is not None:
-            body["externalId"] = external_id
+        return self._request("POST", "/v2/tasks", body, idempotency_key=uuid.uuid4().hex)
 
-        return self._post("/v2/tasks", body)
+    def _task_request(self, topic_id: str, task: dict[str, Any]) -> ApiResponse:
+        """
+        Create one task of a create_tasks_batch() call.
+
+        Each client's create_tasks_batch maps this over the tasks; on
+        AsyncZenzapClient the result is awaitable.
+        """
+        return self._request(
+            "POST", "/v2/tasks", {"topicId": topic_id, **task}, idempotency_key=uuid.uuid4().hex
+        )
 
     def list_tasks(
         self,
@@ -535,7 +906,7 @@ class ZenzapClient:
             "assignee": assignee,
         }
         path = self._build_path("/v2/tasks", params)
-        return self._get(path)
+        return self._request("GET", path)
 
     def get_task(self, task_id: str) -> ApiResponse:
         """
@@ -547,7 +918,7 @@ class ZenzapClient:
         Returns:
             ApiResponse with full task object
         """
-        return self._get(f"/v2/tasks/{quote(task_id, safe='')}")
+        return self._request("GET", f"/v2/tasks/{_quote_segment(task_id)}")
 
     def update_task(
         self,
@@ -574,17 +945,15 @@ class ZenzapClient:
         Returns:
             ApiResponse with id and updatedAt
         """
-        body: dict[str, Any] = {
-            k: v for k, v in {
-                "topicId": topic_id,
-                "title": title,
-                "description": description,
-                "assignee": assignee,
-                "dueDate": due_date,
-                "status": status,
-            }.items() if v is not None
-        }
-        return self._patch(f"/v2/tasks/{quote(task_id, safe='')}", body)
+        body = self._compact(
+            topicId=topic_id,
+            title=title,
+            description=description,
+            assignee=assignee,
+            dueDate=due_date,
+            status=status,
+        )
+        return self._request("PATCH", f"/v2/tasks/{_quote_segment(task_id)}", body)
 
     # =========================================================================
     # Poll Endpoints
@@ -618,7 +987,7 @@ class ZenzapClient:
             "selectionType": selection_type,
             "anonymous": anonymous,
         }
-        return self._post("/v2/polls", body)
+        return self._request("POST", "/v2/polls", body)
 
     def vote_on_poll(self, poll_id: str, option_id: str) -> ApiResponse:
         """
@@ -631,7 +1000,7 @@ class ZenzapClient:
         Returns:
             ApiResponse with vote details
         """
-        return self._post(f"/v2/polls/{quote(poll_id, safe='')}/votes", {"optionId": option_id})
+        return self._request("POST", f"/v2/polls/{_quote_segment(poll_id)}/votes", {"optionId": option_id})
 
     # =========================================================================
     # Long Polling Endpoints
@@ -660,4 +1029,552 @@ class ZenzapClient:
             "offset": offset,
         }
         path = self._build_path("/v2/updates", params)
-        return self._get(path)
+        return self._request("GET", path)
+
+
+class ZenzapClient(_BaseZenzapClient):
+    """
+    Client for the Zenzap External Integration API.
+
+    Handles authentication using Bearer tokens and HMAC-SHA256 signatures.
+
+    Example usage:
+        client = ZenzapClient(
+            api_key="your_bot_api_key",
+            secret="your_bot_secret"
+        )
+
+        # Get current bot info
+        response = client.get_current_member()
+        print(response.data)
+
+        # Create a topic
+        response = client.create_topic(
+            name="My Topic",
+            members=["member-uuid-1", "member-uuid-2"]
+        )
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        secret: str,
+        base_url: str = "https://api.zenzap.co",
+        timeout: float = 30.0,
+        *,
+        etag_cache: Optional[Any] = None,
+        compress_requests: bool = False,
+        max_retries: int = 3,
+        cache_ttl: float = 0.0,
+        retry_writes: bool = False,
+        max_connections: int = 20,
+        transport: str = "requests",
+    ):
+        """
+        Initialize the Zenzap client.
+
+        Args:
+            api_key: Your bot's API key (Bearer token)
+            secret: Your bot's secret for HMAC signatures (BOT_SECRET)
+            base_url: API base URL (default: https://api.zenzap.co)
+            timeout: Request timeout in seconds (default: 30)
+            etag_cache: Optional persistent store for ETag-validated responses
+            compress_requests: Gzip large request bodies (default: False)
+            max_retries: Retries for transient failures of safe requests
+                (default: 3; 0 disables retries); see _BaseZenzapClient
+            cache_ttl: Seconds to cache successful GETs (default: 0, disabled)
+            retry_writes: Also retry POSTs sent with an Idempotency-Key
+                (default: False); see _BaseZenzapClient
+            max_connections: Connections kept open for threads sharing the
+                client (default: 20)
+            transport: HTTP library to use: "requests" (default) or "httpx",
+                which multiplexes concurrent calls over HTTP/2 connections
+        """
+        if transport not in ("requests", "httpx"):
+            raise ValueError(f"Unknown transport {transport!r}; expected 'requests' or 'httpx'")
+
+        super().__init__(
+            api_key,
+            secret,
+            base_url=base_url,
+            timeout=timeout,
+            etag_cache=etag_cache,
+            compress_requests=compress_requests,
+            max_retries=max_retries,
+            cache_ttl=cache_ttl,
+            retry_writes=retry_writes,
+        )
+        # One pooled client per instance keeps TCP/TLS connections alive
+        # between calls
+        self._session: Optional[requests.Session] = None
+        self._http: Optional[httpx.Client] = None
+        if transport == "httpx":
+            import httpx
+
+            self._http = httpx.Client(
+                base_url=self.base_url,
+                headers={"Authorization": f"Bearer {self.api_key}"},
+                transport=httpx.HTTPTransport(
+                    http2=True,
+                    limits=httpx.Limits(
+                        max_connections=max_connections,
+                        max_keepalive_connections=10,
+                    ),
+                ),
+                timeout=timeout,
+            )
+            # Network failures only; UnsupportedProtocol and LocalProtocolError
+            # (e.g. a base_url without a scheme) fail at once, as with requests
+            self._transient_errors: tuple[type[Exception], ...] = (
+                httpx.ConnectError,
+                httpx.TimeoutException,
+                httpx.RemoteProtocolError,
+                httpx.ReadError,
+            )
+            self._connect_errors: tuple[type[Exception], ...] = (httpx.ConnectError, httpx.ConnectTimeout)
+            self._request_errors: tuple[type[Exception], ...] = (httpx.HTTPError,)
+        else:
+            import requests
+            from requests.adapters import HTTPAdapter
+            from urllib3.exceptions import NewConnectionError
+
+            self._session = requests.Session()
+            self._session.headers["Authorization"] = f"Bearer {self.api_key}"
+            # The adapter's default of no retries is kept: _request retries
+            # connection failures and transient responses itself, so the
+            # two layers never multiply
+            adapter = HTTPAdapter(pool_maxsize=max_connections)
+            self._session.mount("https://", adapter)
+            self._session.mount("http://", adapter)
+            self._transient_errors = (requests.ConnectionError, requests.Timeout)
+            self._connect_errors = (requests.ConnectTimeout, NewConnectionError)
+            self._request_errors = (requests.RequestException,)
+        # Worker threads for the bulk helpers, one per pooled connection;
+        # created on first use
+        self._max_workers = max_connections
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+
+    def __enter__(self) -> "ZenzapClient":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the pooled connections and stop the bulk worker threads."""
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+        if self._http is not None:
+            self._http.close()
+        else:
+            self._session.close()
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Return the shared worker pool, creating it on first use."""
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._max_workers,
+                    thread_name_prefix="zenzap",
+                )
+            return self._executor
+
+    def get_topics(self, topic_ids: list[str]) -> list[ApiResponse]:
+        """
+        Get several topics in parallel.
+
+        Requests run on the client's worker threads, at most
+        max_connections at a time.
+
+        Args:
+            topic_ids: UUIDs of the topics
+
+        Returns:
+            List of ApiResponse, one per topic, in request order
+        """
+        return list(self._get_executor().map(self.get_topic, topic_ids))
+
+    def send_messages_bulk(self, messages: list[tuple[str, str]]) -> list[ApiResponse]:
+        """
+        Send several messages in parallel.
+
+        Messages to the same topic may arrive in any order; send them one
+        at a time with send_message when order matters.
+
+        Args:
+            messages: (topic_id, text) pairs
+
+        Returns:
+            List of ApiResponse, one per message, in request order
+        """
+        return list(self._get_executor().map(lambda message: self.send_message(*message), messages))
+
+    def create_tasks_batch(self, topic_id: str, tasks: list[dict[str, Any]]) -> list[ApiResponse]:
+        """
+        Create several tasks in a topic in parallel.
+
+        The API has no batch task endpoint, so each task is still its own
+        request, sent from a worker thread.
+
+        Args:
+            topic_id: UUID of the topic
+            tasks: Task bodies using API field names
+                (title, description, assignee, dueDate, externalId)
+
+        Returns:
+            List of ApiResponse, one per task, in request order
+        """
+        return list(self._get_executor().map(lambda task: self._task_request(topic_id, task), tasks))
+
+    def _request(
+        self,
+        method: str,
+        path: str,
+        body: Optional[dict] = None,
+        cache_ttl: float = 0.0,
+        idempotency_key: Optional[str] = None,
+    ) -> ApiResponse:
+        """
+        Make an authenticated request to the API.
+
+        Handles timestamp generation, HMAC signature, and headers for all methods.
+        GETs, and with retry_writes requests with an idempotency key, are
+        retried with backoff on connection errors, timeouts and
+        RETRY_STATUSES responses.
+
+        Args:
+            method: HTTP method (GET, POST, PATCH, DELETE)
+            path: API path (e.g., "/v2/topics")
+            body: Request body as dictionary (for POST/PATCH/DELETE)
+            cache_ttl: Seconds to cache a successful GET response (0 disables)
+            idempotency_key: Sent as Idempotency-Key; such requests are
+                retried only with retry_writes
+
+        Returns:
+            ApiResponse with status and data
+        """
+        if method == "GET":
+            cache_ttl = max(cache_ttl, self.cache_ttl)
+        if cache_ttl:
+            cached = self._cache.get(path)
+            if cached is not None:
+                return cached
+
+        # httpx resolves the path against the client's base_url itself
+        url = path if self._http is not None else self.base_url + path
+        attempts = self._retry_attempts(method, idempotency_key)
+        attempt = 0
+        while True:
+            # Signed per attempt so the timestamp stays fresh across backoffs
+            headers, body_bytes = self._prepare_request(method, path, body, idempotency_key)
+            revalidated = self._conditional_entry(method, path)
+            if revalidated is not None:
+                headers["If-None-Match"] = revalidated.etag
+
+            attempt += 1
+            try:
+                if self._http is not None:
+                    response = self._http.request(method, url, headers=headers, content=body_bytes)
+                else:
+                    response = self._session.request(
+                        method,
+                        url,
+                        headers=headers,
+                        data=body_bytes,
+                        timeout=self.timeout,
+                    )
+            except self._transient_errors as exception:
+                if not self._may_retry(attempt, attempts, exception):
+                    return ApiResponse.from_exception(exception)
+                time.sleep(self._retry_delay(attempt - 1))
+                continue
+            except self._request_errors as exception:
+                return ApiResponse.from_exception(exception)
+
+            if attempt >= attempts or response.status_code not in self.RETRY_STATUSES:
+                return self._finish_response(method, path, response, revalidated, cache_ttl)
+            time.sleep(self._retry_delay(attempt - 1, response.headers.get("Retry-After")))
+
+
+class AsyncZenzapClient(_BaseZenzapClient):
+    """
+    Asyncio client for the Zenzap External Integration API.
+
+    Exposes the same endpoint methods as ZenzapClient, but every method
+    returns a coroutine. Independent calls can therefore run concurrently
+    with asyncio.gather, all sharing one pooled HTTP/2 connection.
+
+    Example usage:
+        async with AsyncZenzapClient(
+            api_key="your_bot_api_key",
+            secret="your_bot_secret"
+        ) as client:
+            first, second = await asyncio.gather(
+                client.create_task(topic_id=topic_id, title="First"),
+                client.create_task(topic_id=topic_id, title="Second"),
+            )
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        secret: str,
+        base_url: str = "https://api.zenzap.co",
+        timeout: float = 30.0,
+        *,
+        etag_cache: Optional[Any] = None,
+        compress_requests: bool = False,
+        max_retries: int = 3,
+        cache_ttl: float = 0.0,
+        retry_writes: bool = False,
+        max_connections: int = 20,
+    ):
+        """
+        Initialize the async Zenzap client.
+
+        Args:
+            api_key: Your bot's API key (Bearer token)
+            secret: Your bot's secret for HMAC signatures (BOT_SECRET)
+            base_url: API base URL (default: https://api.zenzap.co)
+            timeout: Request timeout in seconds (default: 30)
+            etag_cache: Optional persistent store for ETag-validated responses
+            compress_requests: Gzip large request bodies (default: False)
+            max_retries: Retries for transient failures of safe requests
+                (default: 3; 0 disables retries); see _BaseZenzapClient
+            cache_ttl: Seconds to cache successful GETs (default: 0, disabled)
+            retry_writes: Also retry POSTs sent with an Idempotency-Key
+                (default: False); see _BaseZenzapClient
+            max_connections: Maximum concurrent connections (default: 20)
+        """
+        super().__init__(
+            api_key,
+            secret,
+            base_url=base_url,
+            timeout=timeout,
+            etag_cache=etag_cache,
+            compress_requests=compress_requests,
+            max_retries=max_retries,
+            cache_ttl=cache_ttl,
+            retry_writes=retry_writes,
+        )
+        import httpx
+
+        self._http = httpx.AsyncClient(
+            base_url=self.base_url,
+            headers={"Authorization": f"Bearer {self.api_key}"},
+            transport=httpx.AsyncHTTPTransport(
+                http2=True,
+                limits=httpx.Limits(
+                    max_connections=max_connections,
+                    max_keepalive_connections=10,
+                ),
+            ),
+            timeout=timeout,
+        )
+        self._transient_errors = (
+            httpx.ConnectError,
+            httpx.TimeoutException,
+            httpx.RemoteProtocolError,
+            httpx.ReadError,
+        )
+        self._connect_errors = (httpx.ConnectError, httpx.ConnectTimeout)
+        self._request_errors = (httpx.HTTPError,)
+        # GETs currently on the wire, keyed by path, so identical concurrent
+        # lookups share one request
+        self._inflight: dict[str, asyncio.Task] = {}
+        # Caps the bulk helpers' requests in flight; over HTTP/2 the
+        # connection limit alone would allow many streams per connection
+        self._bulk_limit = asyncio.Semaphore(max_connections)
+
+    async def __aenter__(self) -> "AsyncZenzapClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the underlying connection pool."""
+        await self._http.aclose()
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        body: Optional[dict] = None,
+        cache_ttl: float = 0.0,
+        idempotency_key: Optional[str] = None,
+    ) -> ApiResponse:
+        """
+        Make an authenticated request to the API.
+
+        Args:
+            method: HTTP method (GET, POST, PATCH, DELETE)
+            path: API path (e.g., "/v2/topics")
+            body: Request body as dictionary (for POST/PATCH/DELETE)
+            cache_ttl: Seconds to cache a successful GET response (0 disables)
+            idempotency_key: Sent as Idempotency-Key; such requests are
+                retried only with retry_writes
+
+        Identical GETs issued while one is already in flight await that
+        request instead of sending their own. Other methods are never
+        deduplicated, since repeating them is meaningful.
+
+        Returns:
+            ApiResponse with status and data
+        """
+        if method == "GET":
+            cache_ttl = max(cache_ttl, self.cache_ttl)
+        if cache_ttl:
+            cached = self._cache.get(path)
+            if cached is not None:
+                return cached
+
+        if method != "GET":
+            return await self._send(method, path, body, cache_ttl, idempotency_key)
+
+        task = self._inflight.get(path)
+        joined = task is not None
+        if task is None:
+            task = asyncio.ensure_future(self._send(method, path, body, cache_ttl))
+            self._inflight[path] = task
+            task.add_done_callback(lambda _: self._inflight.pop(path, None))
+        # Shield so one cancelled caller does not cancel the shared request
+        response = await asyncio.shield(task)
+        # Callers that joined someone else's request get their own data
+        return response.copy() if joined else response
+
+    async def _send(
+        self,
+        method: str,
+        path: str,
+        body: Optional[dict],
+        cache_ttl: float,
+        idempotency_key: Optional[str] = None,
+    ) -> ApiResponse:
+        """Sign and send a request, retrying transient failures of safe requests."""
+        attempts = self._retry_attempts(method, idempotency_key)
+        attempt = 0
+        while True:
+            # Signed per attempt so the timestamp stays fresh across backoffs
+            headers, body_bytes = self._prepare_request(method, path, body, idempotency_key)
+            revalidated = self._conditional_entry(method, path)
+            if revalidated is not None:
+                headers["If-None-Match"] = revalidated.etag
+
+            attempt += 1
+            try:
+                response = await self._http.request(
+                    method,
+                    path,
+                    headers=headers,
+                    content=body_bytes,
+                )
+            except self._transient_errors as exception:
+                if not self._may_retry(attempt, attempts, exception):
+                    return ApiResponse.from_exception(exception)
+                await asyncio.sleep(self._retry_delay(attempt - 1))
+                continue
+            except self._request_errors as exception:
+                return ApiResponse.from_exception(exception)
+
+            if attempt >= attempts or response.status_code not in self.RETRY_STATUSES:
+                return self._finish_response(method, path, response, revalidated, cache_ttl)
+            await asyncio.sleep(self._retry_delay(attempt - 1, response.headers.get("Retry-After")))
+
+    async def create_topic_with_bootstrap(
+        self,
+        name: str,
+        members: list[str],
+        description: Optional[str] = None,
+        external_id: Optional[str] = None,
+        initial_messages: Optional[list[str]] = None,
+        initial_tasks: Optional[list[dict[str, Any]]] = None,
+    ) -> BootstrapResult:
+        """
+        Create a topic, then post its opening messages and tasks.
+
+        Once the topic exists, the messages and the tasks are sent
+        concurrently. Messages still go one after another so they appear in
+        the topic in order.
+
+        Args:
+            name: Topic name (max 64 characters)
+            members: List of member UUIDs to add (min 1)
+            description: Optional topic description
+            external_id: Optional external identifier for tracking
+            initial_messages: Message texts to send, in order
+            initial_tasks: Task bodies using API field names
+                (title, description, assignee, dueDate, externalId)
+
+        Returns:
+            BootstrapResult with the topic response and one response per
+            message and task
+        """
+        topic = await self.create_topic(name, members, description, external_id)
+        if not topic.success:
+            return BootstrapResult(topic=topic, messages=[], tasks=[])
+
+        topic_id = topic.data["id"]
+
+        async def send_messages() -> list[ApiResponse]:
+            return [await self.send_message(topic_id, text) for text in initial_messages or ()]
+
+        messages, tasks = await asyncio.gather(
+            send_messages(),
+            self.create_tasks_batch(topic_id, initial_tasks or []),
+        )
+        return BootstrapResult(topic=topic, messages=messages, tasks=tasks)
+
+    async def create_tasks_batch(self, topic_id: str, tasks: list[dict[str, Any]]) -> list[ApiResponse]:
+        """
+        Create several tasks in a topic concurrently.
+
+        Args:
+            topic_id: UUID of the topic
+            tasks: Task bodies using API field names
+                (title, description, assignee, dueDate, externalId)
+
+        Returns:
+            List of ApiResponse, one per task, in request order
+        """
+        return await self._gather_bounded([self._task_request(topic_id, task) for task in tasks])
+
+    async def get_topics(self, topic_ids: list[str]) -> list[ApiResponse]:
+        """
+        Get several topics concurrently.
+
+        Args:
+            topic_ids: UUIDs of the topics
+
+        Returns:
+            List of ApiResponse, one per topic, in request order
+        """
+        return await self._gather_bounded([self.get_topic(topic_id) for topic_id in topic_ids])
+
+    async def send_messages_bulk(self, messages: list[tuple[str, str]]) -> list[ApiResponse]:
+        """
+        Send several messages concurrently.
+
+        Messages to the same topic may arrive in any order; await
+        send_message one at a time when order matters.
+
+        Args:
+            messages: (topic_id, text) pairs
+
+        Returns:
+            List of ApiResponse, one per message, in request order
+        """
+        return await self._gather_bounded(
+            [self.send_message(topic_id, text) for topic_id, text in messages]
+        )
+
+    async def _gather_bounded(self, calls: list[Awaitable[ApiResponse]]) -> list[ApiResponse]:
+        """Await calls concurrently, at most max_connections at a time, in order."""
+        async def run(call: Awaitable[ApiResponse]) -> ApiResponse:
+            async with self._bulk_limit:
+                return await call
+
+        return list(await asyncio.gather(*[run(call) for call in calls]))